@@ -1,4 +1,7 @@
 import os
+import random
+import time
+
 import pandas as pd
 import streamlit as st
 
@@ -11,6 +14,28 @@ load_dotenv()
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 GOOGLE_CREDS_PATH = os.getenv("GOOGLE_SHEETS_CREDENTIALS_PATH")
 
+# Retry Sheets API calls on these HTTP statuses (quota / transient server errors)
+GS_RETRY_STATUSES = {429, 500, 503}
+
+
+def gs_retry(fn, *args, tries=6, base=2, **kwargs):
+    """
+    Call a gspread function, retrying 429/500/503 APIErrors with exponential
+    backoff (base**attempt + jitter seconds, or the server's Retry-After).
+    """
+    for attempt in range(tries):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = getattr(e.response, "status_code", None)
+            if status not in GS_RETRY_STATUSES or attempt == tries - 1:
+                raise
+            try:
+                delay = float(e.response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                delay = base ** attempt + random.random()
+            time.sleep(delay)
+
 
 def get_gsheet_client():
     scope = [
@@ -19,18 +44,27 @@ def get_gsheet_client():
     ]
     creds = ServiceAccountCredentials.from_json_keyfile_name(GOOGLE_CREDS_PATH, scope)
     client = gspread.authorize(creds)
-    return client.open_by_key(GOOGLE_SHEET_ID)
+    return gs_retry(client.open_by_key, GOOGLE_SHEET_ID)
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def load_all_data():
     sh = get_gsheet_client()
+    titles = [ws.title for ws in gs_retry(sh.worksheets)]
+    if not titles:
+        return pd.DataFrame()
+
+    # one batchGet for every tab instead of get_all_values() per worksheet
+    ranges = ["'" + t.replace("'", "''") + "'" for t in titles]
+    resp = gs_retry(sh.values_batch_get, ranges=ranges)
+
     dfs = []
-    for ws in sh.worksheets():
-        values = ws.get_all_values()
+    for title, vr in zip(titles, resp.get("valueRanges", [])):
+        values = gspread.utils.fill_gaps(vr.get("values", []))
         if not values:
             continue
         df = pd.DataFrame(values[1:], columns=values[0])
-        df["Sheet"] = ws.title
+        df["Sheet"] = title
         dfs.append(df)
     if not dfs:
         return pd.DataFrame()
@@ -40,6 +74,10 @@ def load_all_data():
 def main():
     st.title("📊 Job Applications Dashboard")
 
+    # data is cached for 5 minutes; force a fresh read from Google Sheets
+    if st.sidebar.button("Reload"):
+        st.cache_data.clear()
+
     df = load_all_data()
     if df.empty:
         st.warning("No data loaded from Google Sheets.")
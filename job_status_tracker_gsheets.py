@@ -1,14 +1,19 @@
 import os
+import asyncio
 import time
 import random
 import re
 import json
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 import gspread
+import pandas as pd
 from oauth2client.service_account import ServiceAccountCredentials
 
 # Load env variables
@@ -19,7 +24,54 @@ GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 GOOGLE_CREDS_PATH = os.getenv("GOOGLE_SHEETS_CREDENTIALS_PATH")
 HEADLESS = os.getenv("HEADLESS", "False").lower() == "true"
 
+# Number of browser tabs scraping in parallel
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "4"))
+
+# Polite delay range (seconds) between two requests to the same host
+POLITE_DELAY = (3, 6)
+
+# How long (ms) to wait for a known status text to render after page load,
+# and the networkidle cap used when that wait cannot run
+STATUS_WAIT_MS = 5000
+NETWORKIDLE_FALLBACK_MS = 5000
+
+# Image / font / media URLs blocked in the browser – they never carry status text.
+# Blocked via CDP, not context.route, which would turn off the HTTP cache and
+# re-download every site's JS bundles on each row.
+BLOCKED_URL_PATTERNS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*",
+    "*.mp4*", "*.webm*", "*.mp3*",
+]
+
+# Options for the single long-lived browser context. Service workers are
+# blocked so every request is made (and filtered) by the page itself and
+# shares the context's connection pool.
+BROWSER_CONTEXT_OPTIONS = {
+    "service_workers": "block",
+    "java_script_enabled": True,
+    "bypass_csp": True,
+}
+
 WORKDAY_CACHE_PATH = "workday_cache.json"
+SCRAPE_CACHE_PATH = "scrape_cache.sqlite"
+
+# Saved Playwright storage_state (cookies/localStorage) for reusing logins
+LINKEDIN_STATE_PATH = "li_state.json"
+WORKDAY_STATE_PATH = "workday_state_{tenant}.json"
+
+# Scrape cache lifetimes: terminal decisions (rejected/closed) rarely change
+SCRAPE_CACHE_TTL_TERMINAL = 7 * 24 * 3600
+SCRAPE_CACHE_TTL_DEFAULT = 12 * 3600
+
+# Flush pending Decision writes to Sheets after this many rows. Each flush is
+# one batch_update request however many ranges it carries; at ~4 tabs this is
+# about one write a minute, well under the 60/min quota, and a crash loses at
+# most this many statuses.
+WRITE_BATCH_SIZE = 50
+
+# Retry Sheets API calls on these HTTP statuses (quota / transient server errors)
+GS_RETRY_STATUSES = {429, 500, 503}
 
 
 # ============================================================
@@ -76,23 +128,25 @@ WORKDAY_INPROCESS_PATTERNS = [
 # 2. Helpers
 # ============================================================
 
+DOMAIN_MAP = {
+    "linkedin.com": "linkedin",
+    "myworkdayjobs.com": "workday",
+    "greenhouse.io": "greenhouse",
+    "lever.co": "lever",
+    "taleo.net": "taleo",
+    "smartrecruiters.com": "smartrecruiters",
+}
+
+DOMAIN_RE = re.compile("(" + "|".join(re.escape(d) for d in DOMAIN_MAP) + ")")
+
+
+@lru_cache(maxsize=8192)
 def detect_domain(url: str) -> str:
-    url = url.lower()
-    if "linkedin.com" in url:
-        return "linkedin"
-    if "myworkdayjobs.com" in url:
-        return "workday"
-    if "greenhouse.io" in url:
-        return "greenhouse"
-    if "lever.co" in url:
-        return "lever"
-    if "taleo.net" in url:
-        return "taleo"
-    if "smartrecruiters.com" in url:
-        return "smartrecruiters"
-    return "generic"
+    m = DOMAIN_RE.search(url.lower())
+    return DOMAIN_MAP[m.group(1)] if m else "generic"
 
 
+@lru_cache(maxsize=8192)
 def extract_workday_tenant(url: str):
     """
     Examples:
@@ -117,14 +171,107 @@ def load_workday_cache() -> dict:
 
 
 def save_workday_cache(cache: dict) -> None:
-    with open(WORKDAY_CACHE_PATH, "w") as f:
-        json.dump(cache, f, indent=2)
+    # write to a temp file then swap in, so a crash never leaves a half-written cache
+    tmp = WORKDAY_CACHE_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(tmp, WORKDAY_CACHE_PATH)
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a job URL: lowercase scheme/host, no fragment or trailing slash."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def is_terminal_status(status: str) -> bool:
+    return status.startswith("APPLICATION REJECTED") or status.startswith("JOB CLOSED")
+
+
+def open_scrape_cache():
+    conn = sqlite3.connect(SCRAPE_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages ("
+        "url TEXT PRIMARY KEY, ts INTEGER, status TEXT, html BLOB)"
+    )
+    conn.commit()
+    return conn
+
+
+def scrape_cache_get(conn, url: str):
+    """
+    Returns cached page content if still fresh, else None.
+    Terminal statuses use the long TTL, everything else the short one.
+    """
+    row = conn.execute(
+        "SELECT ts, status, html FROM pages WHERE url = ?", (normalize_url(url),)
+    ).fetchone()
+    if not row:
+        return None
+    ts, status, html = row
+    ttl = SCRAPE_CACHE_TTL_TERMINAL if is_terminal_status(status) else SCRAPE_CACHE_TTL_DEFAULT
+    if time.time() - ts > ttl:
+        return None
+    return html
+
+
+def scrape_cache_put(conn, url: str, status: str, html: str) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO pages (url, ts, status, html) VALUES (?, ?, ?, ?)",
+        (normalize_url(url), int(time.time()), status, html),
+    )
+    conn.commit()
 
 
 # ============================================================
 # 3. Google Sheets helpers
 # ============================================================
 
+def gs_retry_delay(e, attempt: int, tries: int, base: float):
+    """
+    Seconds to wait before retrying a gspread APIError, or None if it should be raised:
+    429/500/503 back off base**attempt + jitter seconds, or the server's Retry-After.
+    """
+    status = getattr(e.response, "status_code", None)
+    if status not in GS_RETRY_STATUSES or attempt == tries - 1:
+        return None
+    retry_after = e.response.headers.get("Retry-After")
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = base ** attempt + random.random()
+    print(f"⏳ Sheets API {status} – retrying in {delay:.1f}s ({attempt + 1}/{tries - 1})")
+    return delay
+
+
+def gs_retry(fn, *args, tries=6, base=2, **kwargs):
+    """Call a gspread function, retrying transient APIErrors (see gs_retry_delay)."""
+    for attempt in range(tries):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            delay = gs_retry_delay(e, attempt, tries, base)
+            if delay is None:
+                raise
+            time.sleep(delay)
+
+
+async def gs_retry_async(fn, *args, tries=6, base=2, **kwargs):
+    """
+    gs_retry for the scraping event loop: the blocking HTTP call runs in a
+    worker thread and backoff uses asyncio.sleep, so open pages keep going.
+    """
+    for attempt in range(tries):
+        try:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            delay = gs_retry_delay(e, attempt, tries, base)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+
+
 def get_gsheet():
     if not GOOGLE_SHEET_ID or not GOOGLE_CREDS_PATH:
         raise RuntimeError("GOOGLE_SHEET_ID or GOOGLE_SHEETS_CREDENTIALS_PATH missing in .env")
@@ -135,15 +282,125 @@ def get_gsheet():
     ]
     creds = ServiceAccountCredentials.from_json_keyfile_name(GOOGLE_CREDS_PATH, scope)
     client = gspread.authorize(creds)
-    sh = client.open_by_key(GOOGLE_SHEET_ID)
+    sh = gs_retry(client.open_by_key, GOOGLE_SHEET_ID)
     return sh
 
 
+def a1_sheet_range(title: str) -> str:
+    """Whole-sheet A1 range for a worksheet title, e.g. Sheet 1 → 'Sheet 1'"""
+    return "'" + title.replace("'", "''") + "'"
+
+
+def fetch_all_values(sh, worksheets) -> dict:
+    """
+    Read every worksheet in one spreadsheets.values.batchGet request.
+    Returns {title: values} with rows padded like ws.get_all_values().
+    """
+    if not worksheets:
+        return {}
+    titles = [ws.title for ws in worksheets]
+    resp = gs_retry(sh.values_batch_get, ranges=[a1_sheet_range(t) for t in titles])
+    value_ranges = resp.get("valueRanges", [])
+    return {
+        title: gspread.utils.fill_gaps(vr.get("values", []))
+        for title, vr in zip(titles, value_ranges)
+    }
+
+
 # ============================================================
 # 4. Login functions
 # ============================================================
 
-def linkedin_login(page) -> bool:
+async def new_scrape_page(context):
+    """New page with BLOCKED_URL_PATTERNS dropped by Chromium (HTTP cache stays on)."""
+    page = await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return page
+
+
+async def new_browser_context(browser):
+    """
+    Browser context restored from the saved LinkedIn session if present,
+    otherwise a fresh one.
+    """
+    context = None
+    if Path(LINKEDIN_STATE_PATH).exists():
+        try:
+            context = await browser.new_context(
+                storage_state=LINKEDIN_STATE_PATH, **BROWSER_CONTEXT_OPTIONS
+            )
+        except Exception as e:
+            print(f"⚠️ Could not restore LinkedIn session ({e}); starting fresh.")
+    if context is None:
+        context = await browser.new_context(**BROWSER_CONTEXT_OPTIONS)
+    return context
+
+
+def host_matches(host: str, domain: str) -> bool:
+    """Cookie-style domain match: acme.myworkday.com matches .myworkday.com."""
+    domain = domain.lstrip(".").lower()
+    return host == domain or host.endswith("." + domain) or domain.endswith("." + host)
+
+
+async def save_storage_state(context, path: str, host: str) -> None:
+    """
+    Save the context's storage_state, keeping only cookies / localStorage
+    origins that belong to host – the shared context also holds every other
+    site's session.
+    """
+    state = await context.storage_state()
+    state = {
+        "cookies": [c for c in state.get("cookies", []) if host_matches(host, c.get("domain", ""))],
+        "origins": [
+            o for o in state.get("origins", [])
+            if host_matches(host, urlsplit(o.get("origin", "")).hostname or "")
+        ],
+    }
+    # live session cookies: owner-only file, swapped in atomically
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(state, f)
+    os.chmod(tmp, 0o600)  # O_CREAT keeps the mode of a leftover tmp file
+    os.replace(tmp, path)
+
+
+async def restore_storage_state(page, state: dict) -> None:
+    """Apply a saved storage_state (cookies + localStorage) to the page's live context."""
+    await page.context.add_cookies(state.get("cookies", []))
+    for origin in state.get("origins", []):
+        items = origin.get("localStorage", [])
+        if not items:
+            continue
+        await page.goto(origin["origin"], timeout=45000)
+        await page.evaluate(
+            "items => { for (const {name, value} of items) localStorage.setItem(name, value) }",
+            items,
+        )
+
+
+def linkedin_signed_in(url: str) -> bool:
+    """
+    True on the feed / jobs pages. Checks the path only: an expired session is
+    redirected to /login?session_redirect=...feed..., which contains "feed".
+    """
+    path = urlsplit(url).path
+    return path.startswith("/feed") or path.startswith("/jobs")
+
+
+async def linkedin_login(page) -> bool:
+    # saved session from a previous run: skip the login form if still valid
+    if Path(LINKEDIN_STATE_PATH).exists():
+        try:
+            await page.goto("https://www.linkedin.com/feed/", timeout=45000)
+            if linkedin_signed_in(page.url):
+                print("✅ LinkedIn session restored from saved state.")
+                return True
+        except Exception:
+            pass
+
     email = os.getenv("LINKEDIN_EMAIL")
     pwd = os.getenv("LINKEDIN_PASSWORD")
 
@@ -153,17 +410,19 @@ def linkedin_login(page) -> bool:
 
     print("🌐 Logging into LinkedIn...")
     try:
-        page.goto("https://www.linkedin.com/login", timeout=45000)
-        time.sleep(3)
-        page.fill("#username", email)
-        page.fill("#password", pwd)
-        page.click("button[type=submit]")
+        await page.goto("https://www.linkedin.com/login", timeout=45000)
+        await page.fill("#username", email)
+        await page.fill("#password", pwd)
+        await page.click("button[type=submit]")
 
-        page.wait_for_load_state("networkidle", timeout=45000)
-        time.sleep(4)
+        try:
+            await page.wait_for_url(linkedin_signed_in, timeout=45000)
+        except Exception:
+            pass  # challenged or slow – checked below
 
-        if "feed" in page.url or "/jobs" in page.url:
+        if linkedin_signed_in(page.url):
             print("✅ LinkedIn login successful.")
+            await save_storage_state(page.context, LINKEDIN_STATE_PATH, "linkedin.com")
             return True
 
         print("⚠️ LinkedIn login may be challenged (MFA/captcha). Continuing anyway.")
@@ -173,13 +432,31 @@ def linkedin_login(page) -> bool:
         return False
 
 
-def workday_try_login(page, tenant: str, cache: dict) -> bool:
+async def workday_try_login(page, tenant: str, cache: dict) -> bool:
     """
     Workday login with smart password detection:
     - if tenant in cache: try cached password index first
     - otherwise: try pwd1 then pwd2
     - store result in cache[tenant] = 1 or 2 on success
+    - reuse / save the tenant session in WORKDAY_STATE_PATH
     """
+    login_host = f"{tenant}.myworkday.com"
+    login_url = f"https://{login_host}/{tenant}/login.htm"
+    state_path = Path(WORKDAY_STATE_PATH.format(tenant=tenant))
+
+    # saved session: restore cookies/localStorage and check we are not bounced to /login
+    if state_path.exists():
+        try:
+            with open(state_path, "r") as f:
+                state = json.load(f)
+            await restore_storage_state(page, state)
+            await page.goto(login_url, timeout=45000)
+            if "login" not in page.url.lower():
+                print(f"✅ Workday session restored for tenant {tenant}")
+                return True
+        except Exception:
+            pass
+
     email = os.getenv("WORKDAY_EMAIL")
     pwd1 = os.getenv("WORKDAY_PASSWORD_1")
     pwd2 = os.getenv("WORKDAY_PASSWORD_2")
@@ -188,17 +465,18 @@ def workday_try_login(page, tenant: str, cache: dict) -> bool:
         print("⚠️ Missing Workday credentials in .env.")
         return False
 
-    login_url = f"https://{tenant}.myworkday.com/{tenant}/login.htm"
     print(f"🌐 Workday tenant '{tenant}' login URL: {login_url}")
 
-    def attempt_login(password: str) -> bool:
+    async def attempt_login(password: str) -> bool:
         try:
-            page.goto(login_url, timeout=45000)
-            time.sleep(3)
-            page.fill("input[type=email], input[type=text]", email)
-            page.fill("input[type=password]", password)
-            page.keyboard.press("Enter")
-            time.sleep(5)
+            await page.goto(login_url, timeout=45000)
+            await page.fill("input[type=email], input[type=text]", email)
+            await page.fill("input[type=password]", password)
+            await page.keyboard.press("Enter")
+            try:
+                await page.wait_for_load_state("networkidle", timeout=15000)
+            except Exception:
+                pass  # long-polling pages never go idle – fall through to URL check
             if "login" not in page.url.lower():
                 return True
             return False
@@ -215,16 +493,18 @@ def workday_try_login(page, tenant: str, cache: dict) -> bool:
     for idx in order:
         pwd = pwd1 if idx == 1 else pwd2
         print(f"🔑 Trying Workday password #{idx} for tenant {tenant}...")
-        if attempt_login(pwd):
+        if await attempt_login(pwd):
             print(f"✅ Workday login successful for tenant {tenant} with password #{idx}")
             cache[tenant] = idx
+            save_workday_cache(cache)
+            await save_storage_state(page.context, str(state_path), login_host)
             return True
 
     print(f"❌ Workday login failed for tenant {tenant} with both passwords.")
     return False
 
 
-def greenhouse_login(page) -> bool:
+async def greenhouse_login(page) -> bool:
     """
     Placeholder: Most Greenhouse applications don’t require candidate login.
     If you later use Greenhouse Candidate Portal, implement login here.
@@ -232,7 +512,7 @@ def greenhouse_login(page) -> bool:
     return False
 
 
-def lever_login(page) -> bool:
+async def lever_login(page) -> bool:
     """
     Placeholder: Implement Lever candidate login here if needed later.
     """
@@ -243,53 +523,105 @@ def lever_login(page) -> bool:
 # 5. Status classification
 # ============================================================
 
+# Status categories per domain, highest priority first
+STATUS_RULES = {
+    "linkedin": [
+        ("APPLICATION REJECTED", LINKEDIN_REJECT_PATTERNS),
+        ("APPLICATION UNDER REVIEW", LINKEDIN_REVIEW_PATTERNS),
+        ("APPLICATION VIEWED", LINKEDIN_VIEWED_PATTERNS),
+        ("APPLICATION SUBMITTED", LINKEDIN_SUBMITTED_PATTERNS),
+        ("JOB CLOSED", CLOSED_PATTERNS),
+    ],
+    "workday": [
+        ("APPLICATION REJECTED", WORKDAY_REJECT_PATTERNS),
+        ("APPLICATION IN PROCESS", WORKDAY_INPROCESS_PATTERNS),
+        ("JOB CLOSED", CLOSED_PATTERNS),
+    ],
+    # Greenhouse / Lever / generic posting status
+    "default": [
+        ("JOB CLOSED", CLOSED_PATTERNS),
+    ],
+}
+
+# In-page check used to wait until any of the domain's patterns has rendered
+STATUS_RENDER_JS = """
+patterns => {
+    const text = ((document.body && document.body.innerText) || "").toLowerCase();
+    return patterns.some(p => text.includes(p));
+}
+"""
+
+STATUS_PATTERNS = {
+    key: [p for _, patterns in rules for p in patterns]
+    for key, rules in STATUS_RULES.items()
+}
+
+DOMAIN_LABELS = {
+    "linkedin": "LinkedIn",
+    "workday": "Workday",
+}
+
+
 def classify_status(text: str, domain: str) -> str:
     t = text.lower()
 
-    # LinkedIn – application level
-    if domain == "linkedin":
-        for p in LINKEDIN_REJECT_PATTERNS:
-            if p in t:
-                return "APPLICATION REJECTED (LinkedIn)"
-        for p in LINKEDIN_REVIEW_PATTERNS:
-            if p in t:
-                return "APPLICATION UNDER REVIEW (LinkedIn)"
-        for p in LINKEDIN_VIEWED_PATTERNS:
-            if p in t:
-                return "APPLICATION VIEWED (LinkedIn)"
-        for p in LINKEDIN_SUBMITTED_PATTERNS:
-            if p in t:
-                return "APPLICATION SUBMITTED (LinkedIn)"
-        for p in CLOSED_PATTERNS:
-            if p in t:
-                return "JOB CLOSED (LinkedIn)"
-        return "UNKNOWN (LinkedIn)"
+    rules = STATUS_RULES.get(domain, STATUS_RULES["default"])
+    label = DOMAIN_LABELS.get(domain, domain)
 
-    # Workday – application + posting
-    if domain == "workday":
-        for p in WORKDAY_REJECT_PATTERNS:
-            if p in t:
-                return "APPLICATION REJECTED (Workday)"
-        for p in WORKDAY_INPROCESS_PATTERNS:
+    # plain substring scans: str.__contains__ is memchr-accelerated and beats
+    # a combined regex or Aho-Corasick automaton for this few patterns
+    for category, patterns in rules:
+        for p in patterns:
             if p in t:
-                return "APPLICATION IN PROCESS (Workday)"
-        for p in CLOSED_PATTERNS:
-            if p in t:
-                return "JOB CLOSED (Workday)"
-        return "UNKNOWN (Workday)"
-
-    # Greenhouse / Lever / generic posting status
-    for p in CLOSED_PATTERNS:
-        if p in t:
-            return f"JOB CLOSED ({domain})"
+                return f"{category} ({label})"
 
-    return f"UNKNOWN ({domain})"
+    return f"UNKNOWN ({label})"
 
 
 # ============================================================
 # 6. Sheet processing
 # ============================================================
 
+def decision_ranges(decision_idx: int, statuses: dict) -> list:
+    """
+    Collapse {sheet_row: status} into batch_update entries, one per run of
+    consecutive rows, e.g. rows 2-4 → {"range": "C2:C4", "values": [[s2], [s3], [s4]]}.
+    Only scraped cells are written; other Decision cells are never touched.
+    """
+    col = decision_idx + 1
+    ranges = []
+    run = []
+    for row in sorted(statuses):
+        if run and row != run[-1] + 1:
+            ranges.append(run)
+            run = []
+        run.append(row)
+    if run:
+        ranges.append(run)
+    entries = []
+    for r in ranges:
+        a1 = gspread.utils.rowcol_to_a1(r[0], col)
+        if len(r) > 1:
+            a1 += ":" + gspread.utils.rowcol_to_a1(r[-1], col)
+        entries.append({"range": a1, "values": [[statuses[row]] for row in r]})
+    return entries
+
+
+async def flush_decisions(ws, decision_idx: int, pending: dict) -> None:
+    """
+    Push queued Decision cells in a single batch_update call and clear the queue.
+    pending: {sheet_row: status}
+    """
+    if not pending:
+        return
+    # take the batch before awaiting – other rows keep appending meanwhile
+    batch = dict(pending)
+    pending.clear()
+    await gs_retry_async(
+        ws.batch_update, decision_ranges(decision_idx, batch), value_input_option="RAW"
+    )
+
+
 def find_columns(header_row):
     """
     header_row: list of strings from first row
@@ -306,97 +638,210 @@ def find_columns(header_row):
     return url_idx, decision_idx
 
 
-def process_worksheet(ws, page, workday_cache: dict) -> int:
+def rows_to_check(values, url_idx: int, decision_idx: int):
     """
-    ws: gspread Worksheet
-    Returns number of updated rows.
+    values: padded sheet rows including the header
+    Returns DataFrame[_sheet_row, url, domain] of rows with a URL and an empty Decision.
     """
-    values = ws.get_all_values()
-    if not values:
-        return 0
-
-    header = values[0]
-    url_idx, decision_idx = find_columns(header)
-    if url_idx is None or decision_idx is None:
-        print(f"⚠️ Sheet '{ws.title}': missing 'URL' or 'Decision' column – skipping.")
-        return 0
+    df = pd.DataFrame(values[1:])
+    url = df[url_idx].fillna("").str.strip()
+    decision = df[decision_idx].fillna("").str.strip()
 
-    updated = 0
+    # skip already filled decisions (drop the decision test to force-refresh all)
+    todo = pd.DataFrame({
+        "_sheet_row": df.index + 2,  # 1-based in Sheets, after the header
+        "url": url,
+    })[(url != "") & (decision == "")]
+    todo["domain"] = todo["url"].map(detect_domain)
+    return todo
 
-    for i in range(1, len(values)):  # start from second row
-        row = values[i]
-        sheet_row_idx = i + 1  # 1-based in Sheets
 
-        if len(row) <= max(url_idx, decision_idx):
-            continue
-
-        url = row[url_idx].strip() if len(row) > url_idx and row[url_idx] else ""
-        decision_val = row[decision_idx].strip() if len(row) > decision_idx and row[decision_idx] else ""
-
-        if not url:
-            continue
-
-        # skip already filled decisions (remove this condition to force-refresh all)
-        if decision_val:
-            continue
-
-        domain = detect_domain(url)
-        print(f"[{ws.title}] Row {sheet_row_idx} → visiting ({domain}): {url}")
+class Scraper:
+    """
+    Shared scraping state for one run:
+    - a pool of SCRAPE_CONCURRENCY pages in one browser context
+    - per-host polite delay so parallel tabs don't hammer the same site
+    - one Workday login attempt per tenant
+    """
 
+    def __init__(self, pages, workday_cache: dict, scrape_cache):
+        self.pages = asyncio.Queue()
+        for page in pages:
+            self.pages.put_nowait(page)
+        self.workday_cache = workday_cache
+        self.scrape_cache = scrape_cache
+        self.host_last_ts = {}
+        self.host_locks = {}
+        self.tenant_locks = {}
+        self.tenant_done = set()
+
+    async def page_for(self, url: str):
+        """
+        Take a page for a request to url's host, honouring the polite delay.
+        Lock order is host lock → page → sleep, so only one page per host is
+        ever parked; the timestamp is taken right before the caller's goto.
+        """
+        host = urlsplit(url).netloc.lower()
+        lock = self.host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            page = await self.pages.get()
+            try:
+                last = self.host_last_ts.get(host)
+                if last is not None:
+                    wait = random.uniform(*POLITE_DELAY) - (time.monotonic() - last)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+            except BaseException:
+                self.pages.put_nowait(page)
+                raise
+            self.host_last_ts[host] = time.monotonic()
+        return page
+
+    async def ensure_workday_login(self, tenant: str) -> None:
+        lock = self.tenant_locks.setdefault(tenant, asyncio.Lock())
+        async with lock:
+            if tenant in self.tenant_done:
+                return
+            page = await self.pages.get()
+            try:
+                await workday_try_login(page, tenant, self.workday_cache)
+            finally:
+                self.pages.put_nowait(page)
+            self.tenant_done.add(tenant)
+
+    async def fetch_status(self, url: str, domain: str) -> str:
         # Workday: attempt tenant-specific login using cache
         if domain == "workday":
             tenant = extract_workday_tenant(url)
             if tenant:
-                workday_try_login(page, tenant, workday_cache)
+                await self.ensure_workday_login(tenant)
 
         # Greenhouse / Lever: currently posting-level only (hooks available above)
 
+        page = await self.page_for(url)
         try:
-            page.goto(url, timeout=45000)
-            time.sleep(5)
-            content = page.content()
-            status = classify_status(content, domain)
-        except Exception as e:
-            status = f"ERROR: {type(e).__name__}"
+            try:
+                await page.goto(url, timeout=45000)
+                # Workday / LinkedIn render the status client-side after load:
+                # return as soon as a known status text shows up
+                try:
+                    await page.wait_for_function(
+                        STATUS_RENDER_JS,
+                        arg=STATUS_PATTERNS.get(domain, STATUS_PATTERNS["default"]),
+                        timeout=STATUS_WAIT_MS,
+                        polling=250,
+                    )
+                except PlaywrightTimeoutError:
+                    pass  # no known status rendered – classify what is there
+                except Exception:
+                    # e.g. a client-side redirect destroyed the page context
+                    try:
+                        await page.wait_for_load_state("networkidle", timeout=NETWORKIDLE_FALLBACK_MS)
+                    except Exception:
+                        pass  # long-polling pages never go idle
+                try:
+                    # rendered visible text only – skips <script>/<style> bodies
+                    content = await page.locator("body").inner_text(timeout=10000)
+                except Exception:
+                    content = await page.content()
+                status = classify_status(content, domain)
+                scrape_cache_put(self.scrape_cache, url, status, content)
+            except Exception as e:
+                status = f"ERROR: {type(e).__name__}"
+        finally:
+            self.pages.put_nowait(page)
+        return status
+
+
+async def process_worksheet(ws, values, scraper: Scraper) -> int:
+    """
+    ws: gspread Worksheet
+    values: sheet contents as returned by fetch_all_values
+    Returns number of updated rows.
+    """
+    if len(values) < 2:
+        return 0
 
-        print(f"   → Status: {status}")
-        ws.update_cell(sheet_row_idx, decision_idx + 1, status)
-        updated += 1
+    header = values[0]
+    url_idx, decision_idx = find_columns(header)
+    if url_idx is None or decision_idx is None:
+        print(f"⚠️ Sheet '{ws.title}': missing 'URL' or 'Decision' column – skipping.")
+        return 0
+
+    pending = {}
+
+    todo = rows_to_check(values, url_idx, decision_idx)
 
-        time.sleep(random.uniform(3, 6))
+    async def scrape_one(sheet_row_idx, url: str, domain: str) -> None:
+        cached_html = scrape_cache_get(scraper.scrape_cache, url)
+        if cached_html is not None:
+            print(f"[{ws.title}] Row {sheet_row_idx} → cached ({domain}): {url}")
+            status = classify_status(cached_html, domain)
+        else:
+            print(f"[{ws.title}] Row {sheet_row_idx} → visiting ({domain}): {url}")
+            status = await scraper.fetch_status(url, domain)
 
-    return updated
+        print(f"   [{ws.title}] Row {sheet_row_idx} → Status: {status}")
+        pending[sheet_row_idx] = status
+
+        if len(pending) >= WRITE_BATCH_SIZE:
+            await flush_decisions(ws, decision_idx, pending)
+
+    try:
+        # TaskGroup cancels (and awaits) every sibling row as soon as one fails,
+        # so nothing keeps scraping / writing after the browser is torn down
+        async with asyncio.TaskGroup() as tg:
+            for sheet_row_idx, url, domain in todo.itertuples(index=False, name=None):
+                tg.create_task(scrape_one(sheet_row_idx, url, domain))
+    finally:
+        # siblings are stopped by now: keep whatever finished since the last flush
+        await flush_decisions(ws, decision_idx, pending)
+    return len(todo)
 
 
 # ============================================================
 # 7. MAIN
 # ============================================================
 
-def main():
+async def run():
     sh = get_gsheet()
-    worksheets = sh.worksheets()
+    worksheets = gs_retry(sh.worksheets)
+    sheet_values = fetch_all_values(sh, worksheets)
 
     workday_cache = load_workday_cache()
+    scrape_cache = open_scrape_cache()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=HEADLESS)
-        page = browser.new_page()
-
-        linkedin_logged_in = linkedin_login(page)
-        print(f"LinkedIn logged in: {linkedin_logged_in}")
-
-        total_updated = 0
-        for ws in worksheets:
-            print(f"\n===== Processing sheet: {ws.title} =====")
-            updated = process_worksheet(ws, page, workday_cache)
-            print(f"Sheet '{ws.title}' → updated {updated} rows.")
-            total_updated += updated
-
-        browser.close()
-
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=HEADLESS)
+        context = None
+        try:
+            context = await new_browser_context(browser)
+            pages = [await new_scrape_page(context) for _ in range(max(1, SCRAPE_CONCURRENCY))]
+
+            linkedin_logged_in = await linkedin_login(pages[0])
+            print(f"LinkedIn logged in: {linkedin_logged_in}")
+
+            scraper = Scraper(pages, workday_cache, scrape_cache)
+
+            total_updated = 0
+            for ws in worksheets:
+                print(f"\n===== Processing sheet: {ws.title} =====")
+                updated = await process_worksheet(ws, sheet_values.get(ws.title, []), scraper)
+                print(f"Sheet '{ws.title}' → updated {updated} rows.")
+                total_updated += updated
+        finally:
+            if context is not None:
+                await context.close()
+            await browser.close()
+
+    scrape_cache.close()
     save_workday_cache(workday_cache)
     print(f"\n🎉 DONE – total rows updated: {total_updated}")
 
 
+def main():
+    asyncio.run(run())
+
+
 if __name__ == "__main__":
     main()